@@ -6,6 +6,9 @@
 # http://svn.apache.org/viewvc/avro/trunk/lang/py/src/avro/ which is under
 # Apache 2.0 license (http://www.apache.org/licenses/LICENSE-2.0)
 
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+
 import bz2
 import lzma
 import zlib
@@ -49,8 +52,86 @@ class ReadError(Exception):
     pass
 
 
+cdef class _BlockReader:
+    """File-like reader over the decoded bytes of a block.
+
+    The primitive readers below recognize it and decode straight from its
+    buffer rather than calling read() for every value (or every byte, in the
+    case of varints).
+    """
+    cdef bytes data
+    cdef const unsigned char *buf
+    cdef Py_ssize_t pos
+    cdef Py_ssize_t size
+
+    def __init__(self, bytes data):
+        self.data = data
+        self.buf = data
+        self.pos = 0
+        self.size = len(data)
+
+    cpdef bytes read(self, Py_ssize_t n=-1):
+        cdef Py_ssize_t start = self.pos
+        if n < 0 or n > self.size - start:
+            n = self.size - start
+        self.pos = start + n
+        return PyBytes_FromStringAndSize(<const char *>self.buf + start, n)
+
+    def tell(self):
+        return self.pos
+
+    cdef const unsigned char *read_chars(self, Py_ssize_t n):
+        """Return a pointer to the next n bytes and move past them, or NULL
+        if n is negative or fewer than n bytes are left."""
+        cdef Py_ssize_t start = self.pos
+        if n < 0 or n > self.size - start:
+            return NULL
+        self.pos = start + n
+        return self.buf + start
+
+    cdef int skip(self, Py_ssize_t n) except -1:
+        """Move past the next n bytes, stopping at the end of the block."""
+        if n < 0:
+            raise EOFError(f"Expected {n} bytes")
+        if n > self.size - self.pos:
+            self.pos = self.size
+        else:
+            self.pos += n
+
+    cdef long64 read_long(self) except? -1:
+        cdef ulong64 b
+        cdef ulong64 n = 0
+        cdef int32 shift = 0
+        cdef Py_ssize_t pos = self.pos
+
+        # Most varints (lengths, counts, union and enum indexes) are a single
+        # byte, so handle those before setting up the loop
+        if pos < self.size:
+            b = self.buf[pos]
+            if (b & 0x80) == 0:
+                self.pos = pos + 1
+                return (b >> 1) ^ -(b & 1)
+
+        while True:
+            if pos >= self.size:
+                self.pos = pos
+                raise EOFError
+            b = self.buf[pos]
+            pos += 1
+            n |= (b & 0x7F) << shift
+            shift += 7
+            if (b & 0x80) == 0:
+                break
+
+        self.pos = pos
+        return (n >> 1) ^ -(n & 1)
+
+
 cpdef _default_named_schemas():
-    return {"writer": {}, "reader": {}}
+    # "writer" and "reader" map names to named schemas. "records" maps the ids
+    # of the (writer record, reader record) pairs met while reading to the
+    # field matching worked out by _resolve_record
+    return {"writer": {}, "reader": {}, "records": {}}
 
 
 cpdef match_types(writer_type, reader_type, named_schemas):
@@ -146,7 +227,16 @@ cpdef inline read_boolean(fo):
     1 (true).
     """
     cdef unsigned char ch_temp
-    cdef bytes bytes_temp = fo.read(1)
+    cdef const unsigned char *p
+    cdef bytes bytes_temp
+
+    if type(fo) is _BlockReader:
+        p = (<_BlockReader>fo).read_chars(1)
+        if p == NULL:
+            raise ReadError
+        return p[0] != 0
+
+    bytes_temp = fo.read(1)
     if len(bytes_temp) == 1:
         # technically 0x01 == true and 0x00 == false, but many languages will
         # cast anything other than 0 to True and only 0 to False
@@ -160,7 +250,10 @@ cpdef inline skip_boolean(fo):
     """A boolean is written as a single byte whose value is either 0 (false) or
     1 (true).
     """
-    fo.read(1)
+    if type(fo) is _BlockReader:
+        (<_BlockReader>fo).skip(1)
+    else:
+        fo.read(1)
 
 
 cpdef long64 read_long(fo) except? -1:
@@ -169,7 +262,12 @@ cpdef long64 read_long(fo) except? -1:
     cdef ulong64 b
     cdef ulong64 n
     cdef int32 shift
-    cdef bytes c = fo.read(1)
+    cdef bytes c
+
+    if type(fo) is _BlockReader:
+        return (<_BlockReader>fo).read_long()
+
+    c = fo.read(1)
 
     # We do EOF checking only here, since most reader start here
     if not c:
@@ -179,8 +277,13 @@ cpdef long64 read_long(fo) except? -1:
     n = b & 0x7F
     shift = 7
 
+    if (b & 0x80) == 0:
+        return (n >> 1) ^ -(n & 1)
+
+    # Multi-byte value, avoid looking up fo.read for every remaining byte
+    read = fo.read
     while (b & 0x80) != 0:
-        c = fo.read(1)
+        c = read(1)
         b = <unsigned char>(c[0])
         n |= (b & 0x7F) << shift
         shift += 7
@@ -192,12 +295,21 @@ cpdef skip_long(fo):
     """int and long values are written using variable-length, zig-zag
     coding."""
     cdef ulong64 b
-    cdef bytes c = fo.read(1)
+    cdef bytes c
+
+    if type(fo) is _BlockReader:
+        (<_BlockReader>fo).read_long()
+        return
 
+    c = fo.read(1)
     b = <unsigned char>(c[0])
 
+    if (b & 0x80) == 0:
+        return
+
+    read = fo.read
     while (b & 0x80) != 0:
-        c = fo.read(1)
+        c = read(1)
         b = <unsigned char>(c[0])
 
 
@@ -217,11 +329,19 @@ cpdef read_float(fo):
     Java's floatToIntBits and then encoded in little-endian format.
     """
     cdef bytes data
-    cdef unsigned char ch_data[4]
+    cdef const unsigned char *ch_data
     cdef float_uint32 fi
-    data = fo.read(4)
-    if len(data) == 4:
-        ch_data[:4] = data
+
+    if type(fo) is _BlockReader:
+        ch_data = (<_BlockReader>fo).read_chars(4)
+    else:
+        data = fo.read(4)
+        if len(data) == 4:
+            ch_data = data
+        else:
+            ch_data = NULL
+
+    if ch_data != NULL:
         fi.n = (ch_data[0]
                 | (ch_data[1] << 8)
                 | (ch_data[2] << 16)
@@ -237,7 +357,10 @@ cpdef skip_float(fo):
     The float is converted into a 32-bit integer using a method equivalent to
     Java's floatToIntBits and then encoded in little-endian format.
     """
-    fo.read(4)
+    if type(fo) is _BlockReader:
+        (<_BlockReader>fo).skip(4)
+    else:
+        fo.read(4)
 
 
 cdef union double_ulong64:
@@ -252,11 +375,19 @@ cpdef read_double(fo):
     Java's doubleToLongBits and then encoded in little-endian format.
     """
     cdef bytes data
-    cdef unsigned char ch_data[8]
+    cdef const unsigned char *ch_data
     cdef double_ulong64 dl
-    data = fo.read(8)
-    if len(data) == 8:
-        ch_data[:8] = data
+
+    if type(fo) is _BlockReader:
+        ch_data = (<_BlockReader>fo).read_chars(8)
+    else:
+        data = fo.read(8)
+        if len(data) == 8:
+            ch_data = data
+        else:
+            ch_data = NULL
+
+    if ch_data != NULL:
         dl.n = (ch_data[0]
                 | (<ulong64>(ch_data[1]) << 8)
                 | (<ulong64>(ch_data[2]) << 16)
@@ -276,13 +407,22 @@ cpdef skip_double(fo):
     The double is converted into a 64-bit integer using a method equivalent to
     Java's doubleToLongBits and then encoded in little-endian format.
     """
-    fo.read(8)
+    if type(fo) is _BlockReader:
+        (<_BlockReader>fo).skip(8)
+    else:
+        fo.read(8)
 
 
 cpdef read_bytes(fo):
     """Bytes are encoded as a long followed by that many bytes of data."""
     cdef long64 size = read_long(fo)
-    out =  fo.read(<long>size)
+    if type(fo) is _BlockReader:
+        # A negative size would mean "read everything left" to read()
+        if size < 0:
+            raise EOFError(f"Expected {size} bytes, read 0")
+        out = (<_BlockReader>fo).read(<Py_ssize_t>size)
+    else:
+        out = fo.read(<long>size)
     if len(out) != size:
         raise EOFError(f"Expected {size} bytes, read {len(out)}")
     return out
@@ -291,13 +431,27 @@ cpdef read_bytes(fo):
 cpdef skip_bytes(fo):
     """Bytes are encoded as a long followed by that many bytes of data."""
     cdef long64 size = read_long(fo)
-    fo.read(<long>size)
+    if type(fo) is _BlockReader:
+        (<_BlockReader>fo).skip(<Py_ssize_t>size)
+    else:
+        fo.read(<long>size)
 
 
 cpdef unicode read_utf8(fo, handle_unicode_errors="strict"):
     """A string is encoded as a long followed by that many bytes of UTF-8
     encoded character data.
     """
+    cdef long64 size
+    cdef const unsigned char *p
+
+    if type(fo) is _BlockReader and handle_unicode_errors == "strict":
+        # Decode straight from the block instead of copying into bytes first
+        size = read_long(fo)
+        p = (<_BlockReader>fo).read_chars(<Py_ssize_t>size)
+        if p == NULL:
+            raise EOFError(f"Expected {size} bytes, read {len(fo.read())}")
+        return PyUnicode_DecodeUTF8(<const char *>p, <Py_ssize_t>size, NULL)
+
     return read_bytes(fo).decode(errors=handle_unicode_errors)
 
 
@@ -368,6 +522,9 @@ cpdef read_array(
     cdef long64 block_count
     cdef long64 i
 
+    items_schema = writer_schema["items"]
+    reader_items_schema = reader_schema["items"] if reader_schema else None
+
     read_items = []
 
     block_count = read_long(fo)
@@ -378,24 +535,14 @@ cpdef read_array(
             # Read block size, unused
             read_long(fo)
 
-        if reader_schema:
-            for i in range(block_count):
-                read_items.append(_read_data(
-                    fo,
-                    writer_schema["items"],
-                    named_schemas,
-                    reader_schema["items"],
-                    options,
-                ))
-        else:
-            for i in range(block_count):
-                read_items.append(_read_data(
-                    fo,
-                    writer_schema["items"],
-                    named_schemas,
-                    None,
-                    options,
-                ))
+        for i in range(block_count):
+            read_items.append(_read_data(
+                fo,
+                items_schema,
+                named_schemas,
+                reader_items_schema,
+                options,
+            ))
         block_count = read_long(fo)
 
     return read_items
@@ -450,6 +597,10 @@ cpdef read_map(
     cdef long64 i
     cdef unicode key
 
+    values_schema = writer_schema["values"]
+    reader_values_schema = reader_schema["values"] if reader_schema else None
+    handle_unicode_errors = options.get("handle_unicode_errors", "strict")
+
     read_items = {}
     block_count = read_long(fo)
     while block_count != 0:
@@ -458,26 +609,15 @@ cpdef read_map(
             # Read block size, unused
             read_long(fo)
 
-        if reader_schema:
-            for i in range(block_count):
-                key = read_utf8(fo, options.get("handle_unicode_errors", "strict"))
-                read_items[key] = _read_data(
-                    fo,
-                    writer_schema["values"],
-                    named_schemas,
-                    reader_schema["values"],
-                    options,
-                )
-        else:
-            for i in range(block_count):
-                key = read_utf8(fo, options.get("handle_unicode_errors", "strict"))
-                read_items[key] = _read_data(
-                    fo,
-                    writer_schema["values"],
-                    named_schemas,
-                    None,
-                    options,
-                )
+        for i in range(block_count):
+            key = read_utf8(fo, handle_unicode_errors)
+            read_items[key] = _read_data(
+                fo,
+                values_schema,
+                named_schemas,
+                reader_values_schema,
+                options,
+            )
         block_count = read_long(fo)
 
     return read_items
@@ -527,6 +667,11 @@ cpdef read_union(
     idx_schema = writer_schema[index]
     idx_reader_schema = None
 
+    if idx_schema == "null" and not reader_schema:
+        # Optional values are by far the most common unions and a null is
+        # always read as a plain None, so skip the generic handling below
+        return None
+
     if reader_schema:
         msg = f"schema mismatch: {writer_schema} not found in {reader_schema}"
         # Handle case where the reader schema is just a single type (not union)
@@ -607,6 +752,66 @@ cpdef skip_union(fo, writer_schema, named_schemas):
     _skip_data(fo, writer_schema[index], named_schemas)
 
 
+cdef _resolve_record(writer_schema, reader_schema, named_schemas):
+    """Match the fields of a writer record to those of a reader record
+
+    Returns a list of (writer type, reader name, reader type) for each writer
+    field, where reader name is None for fields the reader does not have, the
+    (name, default) pairs of reader fields missing from the writer and the
+    message to raise if one of those has no default.
+
+    The result is kept in the reader's named_schemas so it is only worked out
+    once per reader. The schemas are stored with it so that their ids cannot
+    be reused by other objects while the entry exists.
+    """
+    resolved = named_schemas.get("records")
+    key = (id(writer_schema), id(reader_schema))
+    if resolved is not None:
+        cached = resolved.get(key)
+        if (
+            cached is not None
+            and cached[0] is writer_schema
+            and cached[1] is reader_schema
+        ):
+            return cached[2]
+
+    readers_field_dict = {}
+    aliases_field_dict = {}
+    for f in reader_schema["fields"]:
+        readers_field_dict[f["name"]] = f
+        for alias in f.get("aliases", []):
+            aliases_field_dict[alias] = f
+
+    fields = []
+    matched = set()
+    for field in writer_schema["fields"]:
+        readers_field = readers_field_dict.get(
+            field["name"],
+            aliases_field_dict.get(field["name"]),
+        )
+        if readers_field:
+            fields.append((field["type"], readers_field["name"], readers_field["type"]))
+            matched.add(readers_field["name"])
+        else:
+            fields.append((field["type"], None, None))
+
+    defaults = []
+    error = None
+    writer_fields = {f["name"] for f in writer_schema["fields"]}
+    for f_name, field in readers_field_dict.items():
+        if f_name not in writer_fields and f_name not in matched:
+            if "default" in field:
+                defaults.append((field["name"], field["default"]))
+            else:
+                error = f"No default value for field {field['name']} in {reader_schema['name']}"
+                break
+
+    resolution = (fields, defaults, error)
+    if resolved is not None:
+        resolved[key] = (writer_schema, reader_schema, resolution)
+    return resolution
+
+
 cpdef read_record(
     fo,
     writer_schema,
@@ -632,50 +837,36 @@ cpdef read_record(
          writer's schema does not have a field with the same name, then the
          field's value is unset.
     """
-    record = {}
     if reader_schema is None:
-        for field in writer_schema["fields"]:
-            record[field["name"]] = _read_data(
-                fo,
-                field["type"],
-                named_schemas,
-                None,
-                options,
+        # Build the record in one go rather than assigning field by field
+        return {
+            field["name"]: _read_data(
+                fo, field["type"], named_schemas, None, options
             )
+            for field in writer_schema["fields"]
+        }
     else:
-        readers_field_dict = {}
-        aliases_field_dict = {}
-        for f in reader_schema["fields"]:
-            readers_field_dict[f["name"]] = f
-            for alias in f.get("aliases", []):
-                aliases_field_dict[alias] = f
-
-        for field in writer_schema["fields"]:
-            readers_field = readers_field_dict.get(
-                field["name"],
-                aliases_field_dict.get(field["name"]),
-            )
-            if readers_field:
-                record[readers_field["name"]] = _read_data(
+        fields, defaults, error = _resolve_record(
+            writer_schema, reader_schema, named_schemas
+        )
+        record = {}
+        for writer_type, reader_name, reader_type in fields:
+            if reader_name is None:
+                _skip_data(fo, writer_type, named_schemas)
+            else:
+                record[reader_name] = _read_data(
                     fo,
-                    field["type"],
+                    writer_type,
                     named_schemas,
-                    readers_field["type"],
+                    reader_type,
                     options,
                 )
-            else:
-                _skip_data(fo, field["type"], named_schemas)
 
         # fill in default values
-        if len(readers_field_dict) > len(record):
-            writer_fields = [f["name"] for f in writer_schema["fields"]]
-            for f_name, field in readers_field_dict.items():
-                if f_name not in writer_fields and f_name not in record:
-                    if "default" in field:
-                        record[field["name"]] = field["default"]
-                    else:
-                        msg = f"No default value for field {field['name']} in {reader_schema['name']}"
-                        raise SchemaResolutionError(msg)
+        if error is not None:
+            raise SchemaResolutionError(error)
+        for name, default in defaults:
+            record[name] = default
 
     return record
 
@@ -951,6 +1142,8 @@ def _iter_avro_records(
             return
 
         block_fo = read_block(fo)
+        if type(block_fo) is BytesIO:
+            block_fo = _BlockReader(block_fo.getvalue())
 
         for i in range(block_count):
             yield _read_data(
@@ -12,10 +12,10 @@ from datetime import datetime, timezone
 from decimal import Context
 from io import BytesIO
 from struct import error as StructError
-from typing import IO, Union, Optional, Generic, TypeVar, Iterator, Dict
+from typing import IO, Union, Optional, Generic, TypeVar, Iterator, Dict, Any
 from warnings import warn
 
-from .io.binary_decoder import BinaryDecoder
+from .io.binary_decoder import BinaryDecoder, BytesDecoder
 from .io.json_decoder import AvroJSONDecoder
 from .logical_readers import LOGICAL_READERS
 from .schema import (
@@ -25,7 +25,7 @@ from .schema import (
     extract_logical_type,
     parse_schema,
 )
-from .types import Schema, AvroMessage, NamedSchemas
+from .types import Schema, AvroMessage
 from ._read_common import (
     SchemaResolutionError,
     MAGIC,
@@ -42,8 +42,11 @@ epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
 epoch_naive = datetime(1970, 1, 1)
 
 
-def _default_named_schemas() -> Dict[str, NamedSchemas]:
-    return {"writer": {}, "reader": {}}
+def _default_named_schemas() -> Dict[str, Dict[Any, Any]]:
+    # "writer" and "reader" map names to named schemas. "records" maps the ids
+    # of the (writer record, reader record) pairs met while reading to the
+    # field matching worked out by _resolve_record
+    return {"writer": {}, "reader": {}, "records": {}}
 
 
 def match_types(writer_type, reader_type, named_schemas):
@@ -288,27 +291,8 @@ def read_array(
     reader_schema=None,
     options={},
 ):
-    if reader_schema:
-
-        def item_reader(decoder, w_schema, r_schema, options):
-            return read_data(
-                decoder,
-                w_schema["items"],
-                named_schemas,
-                r_schema["items"],
-                options,
-            )
-
-    else:
-
-        def item_reader(decoder, w_schema, r_schema, options):
-            return read_data(
-                decoder,
-                w_schema["items"],
-                named_schemas,
-                None,
-                options,
-            )
+    items_schema = writer_schema["items"]
+    reader_items_schema = reader_schema["items"] if reader_schema else None
 
     read_items = []
 
@@ -316,10 +300,11 @@ def read_array(
 
     for item in decoder.iter_array():
         read_items.append(
-            item_reader(
+            read_data(
                 decoder,
-                writer_schema,
-                reader_schema,
+                items_schema,
+                named_schemas,
+                reader_items_schema,
                 options,
             )
         )
@@ -345,27 +330,8 @@ def read_map(
     reader_schema=None,
     options={},
 ):
-    if reader_schema:
-
-        def item_reader(decoder, w_schema, r_schema):
-            return read_data(
-                decoder,
-                w_schema["values"],
-                named_schemas,
-                r_schema["values"],
-                options,
-            )
-
-    else:
-
-        def item_reader(decoder, w_schema, r_schema):
-            return read_data(
-                decoder,
-                w_schema["values"],
-                named_schemas,
-                None,
-                options,
-            )
+    values_schema = writer_schema["values"]
+    reader_values_schema = reader_schema["values"] if reader_schema else None
 
     read_items = {}
 
@@ -373,7 +339,13 @@ def read_map(
 
     for item in decoder.iter_map():
         key = decoder.read_utf8()
-        read_items[key] = item_reader(decoder, writer_schema, reader_schema)
+        read_items[key] = read_data(
+            decoder,
+            values_schema,
+            named_schemas,
+            reader_values_schema,
+            options,
+        )
 
     decoder.read_map_end()
 
@@ -402,6 +374,11 @@ def read_union(
     idx_schema = writer_schema[index]
     idx_reader_schema = None
 
+    if idx_schema == "null" and not reader_schema:
+        # Optional values are by far the most common unions and a null is
+        # always read as a plain None, so skip the generic handling below
+        return decoder.read_null()
+
     if reader_schema:
         msg = f"schema mismatch: {writer_schema} not found in {reader_schema}"
         # Handle case where the reader schema is just a single type (not union)
@@ -477,6 +454,66 @@ def skip_union(decoder, writer_schema, named_schemas):
     skip_data(decoder, writer_schema[index], named_schemas)
 
 
+def _resolve_record(writer_schema, reader_schema, named_schemas):
+    """Match the fields of a writer record to those of a reader record
+
+    Returns a list of (writer type, reader name, reader type) for each writer
+    field, where reader name is None for fields the reader does not have, the
+    (name, default) pairs of reader fields missing from the writer and the
+    message to raise if one of those has no default.
+
+    The result is kept in the reader's named_schemas so it is only worked out
+    once per reader. The schemas are stored with it so that their ids cannot
+    be reused by other objects while the entry exists.
+    """
+    resolved = named_schemas.get("records")
+    key = (id(writer_schema), id(reader_schema))
+    if resolved is not None:
+        cached = resolved.get(key)
+        if (
+            cached is not None
+            and cached[0] is writer_schema
+            and cached[1] is reader_schema
+        ):
+            return cached[2]
+
+    readers_field_dict = {}
+    aliases_field_dict = {}
+    for f in reader_schema["fields"]:
+        readers_field_dict[f["name"]] = f
+        for alias in f.get("aliases", []):
+            aliases_field_dict[alias] = f
+
+    fields = []
+    matched = set()
+    for field in writer_schema["fields"]:
+        readers_field = readers_field_dict.get(
+            field["name"],
+            aliases_field_dict.get(field["name"]),
+        )
+        if readers_field:
+            fields.append((field["type"], readers_field["name"], readers_field["type"]))
+            matched.add(readers_field["name"])
+        else:
+            fields.append((field["type"], None, None))
+
+    defaults = []
+    error = None
+    writer_fields = {f["name"] for f in writer_schema["fields"]}
+    for f_name, field in readers_field_dict.items():
+        if f_name not in writer_fields and f_name not in matched:
+            if "default" in field:
+                defaults.append((field["name"], field["default"]))
+            else:
+                error = f"No default value for field {field['name']} in {reader_schema['name']}"
+                break
+
+    resolution = (fields, defaults, error)
+    if resolved is not None:
+        resolved[key] = (writer_schema, reader_schema, resolution)
+    return resolution
+
+
 def read_record(
     decoder,
     writer_schema,
@@ -502,50 +539,36 @@ def read_record(
          writer's schema does not have a field with the same name, then the
          field's value is unset.
     """
-    record = {}
     if reader_schema is None:
-        for field in writer_schema["fields"]:
-            record[field["name"]] = read_data(
-                decoder,
-                field["type"],
-                named_schemas,
-                None,
-                options,
+        # Build the record in one go rather than assigning field by field
+        return {
+            field["name"]: read_data(
+                decoder, field["type"], named_schemas, None, options
             )
+            for field in writer_schema["fields"]
+        }
     else:
-        readers_field_dict = {}
-        aliases_field_dict = {}
-        for f in reader_schema["fields"]:
-            readers_field_dict[f["name"]] = f
-            for alias in f.get("aliases", []):
-                aliases_field_dict[alias] = f
-
-        for field in writer_schema["fields"]:
-            readers_field = readers_field_dict.get(
-                field["name"],
-                aliases_field_dict.get(field["name"]),
-            )
-            if readers_field:
-                record[readers_field["name"]] = read_data(
+        fields, defaults, error = _resolve_record(
+            writer_schema, reader_schema, named_schemas
+        )
+        record = {}
+        for writer_type, reader_name, reader_type in fields:
+            if reader_name is None:
+                skip_data(decoder, writer_type, named_schemas)
+            else:
+                record[reader_name] = read_data(
                     decoder,
-                    field["type"],
+                    writer_type,
                     named_schemas,
-                    readers_field["type"],
+                    reader_type,
                     options,
                 )
-            else:
-                skip_data(decoder, field["type"], named_schemas)
 
         # fill in default values
-        if len(readers_field_dict) > len(record):
-            writer_fields = [f["name"] for f in writer_schema["fields"]]
-            for f_name, field in readers_field_dict.items():
-                if f_name not in writer_fields and f_name not in record:
-                    if "default" in field:
-                        record[field["name"]] = field["default"]
-                    else:
-                        msg = f"No default value for field {field['name']} in {reader_schema['name']}"
-                        raise SchemaResolutionError(msg)
+        if error is not None:
+            raise SchemaResolutionError(error)
+        for name, default in defaults:
+            record[name] = default
 
     return record
 
@@ -791,10 +814,14 @@ def _iter_avro_records(
             return
 
         block_fo = read_block(decoder)
+        if type(block_fo) is BytesIO:
+            block_decoder = BytesDecoder(block_fo)
+        else:
+            block_decoder = BinaryDecoder(block_fo)
 
         for i in range(block_count):
             yield read_data(
-                BinaryDecoder(block_fo),
+                block_decoder,
                 writer_schema,
                 named_schemas,
                 reader_schema,
@@ -1272,7 +1299,7 @@ def schemaless_reader(
         # No need for the reader schema if they are the same
         reader_schema = None
 
-    named_schemas: Dict[str, NamedSchemas] = _default_named_schemas()
+    named_schemas: Dict[str, Dict[Any, Any]] = _default_named_schemas()
     writer_schema = parse_schema(writer_schema, named_schemas["writer"])
 
     if reader_schema:
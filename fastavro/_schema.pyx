@@ -3,10 +3,10 @@
 import hashlib
 from io import StringIO
 from os import path
-from copy import deepcopy
 import json
 from libc.math cimport floor, log10
 import re
+from sys import intern
 
 from .repository import FlatDictRepository, SchemaRepositoryError
 from .const import AVRO_TYPES
@@ -471,7 +471,14 @@ cdef parse_field(field, namespace, expand, names, named_schemas, ignore_default_
 
     default = field.get("default", NO_DEFAULT)
 
-    parsed_field["name"] = field["name"]
+    # Field names end up as the keys of every record read so intern them to
+    # make key lookups against literal strings a pointer comparison. Only
+    # exact strs can be interned, so anything else, such as a str enum, is
+    # kept as given.
+    name = field["name"]
+    if type(name) is str:
+        name = intern(name)
+    parsed_field["name"] = name
     parsed_field["type"] = _parse_schema(
         field["type"],
         namespace,
@@ -533,7 +540,10 @@ cdef _parse_schema_with_repo(
     injected_schemas,
 ):
     try:
-        schema_copy = deepcopy(named_schemas)
+        # Snapshot the known names so a failed attempt can be rolled back.
+        # parse_schema only ever adds entries and never mutates the parsed
+        # schemas already stored, so a shallow copy is enough
+        schema_copy = dict(named_schemas)
         return parse_schema(schema, named_schemas=named_schemas, _write_hint=write_hint)
     except UnknownType as error:
         missing_subject = error.name
@@ -706,13 +716,10 @@ cdef _to_parsing_canonical_form(schema, fo):
 
         elif schema_type == "enum":
             name = schema["name"]
-            fo.write(f'{{"name":"{name}","type":"{schema_type}","symbols":[')
-
-            for idx, symbol in enumerate(schema["symbols"]):
-                if idx != 0:
-                    fo.write(",")
-                fo.write(f'"{symbol}"')
-            fo.write("]}")
+            symbols = ",".join([f'"{symbol}"' for symbol in schema["symbols"]])
+            fo.write(
+                f'{{"name":"{name}","type":"{schema_type}","symbols":[{symbols}]}}'
+            )
 
         elif schema_type == "fixed":
             name = schema["name"]
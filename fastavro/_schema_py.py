@@ -2,8 +2,8 @@ import hashlib
 from io import StringIO
 import math
 from os import path
-from copy import deepcopy
 import re
+from sys import intern
 from typing import Tuple, Set, Optional, List, Any
 
 from .types import DictSchema, Schema, NamedSchemas
@@ -596,7 +596,14 @@ def parse_field(field, namespace, expand, names, named_schemas, ignore_default_e
 
     default = field.get("default", NO_DEFAULT)
 
-    parsed_field["name"] = field["name"]
+    # Field names end up as the keys of every record read so intern them to
+    # make key lookups against literal strings a pointer comparison. Only
+    # exact strs can be interned, so anything else, such as a str enum, is
+    # kept as given.
+    name = field["name"]
+    if type(name) is str:
+        name = intern(name)
+    parsed_field["name"] = name
     parsed_field["type"] = _parse_schema(
         field["type"],
         namespace,
@@ -716,7 +723,10 @@ def _parse_schema_with_repo(
     injected_schemas,
 ):
     try:
-        schema_copy = deepcopy(named_schemas)
+        # Snapshot the known names so a failed attempt can be rolled back.
+        # parse_schema only ever adds entries and never mutates the parsed
+        # schemas already stored, so a shallow copy is enough
+        schema_copy = dict(named_schemas)
         return parse_schema(
             schema,
             named_schemas=named_schemas,
@@ -958,13 +968,10 @@ def _to_parsing_canonical_form(schema, fo):
 
         elif schema_type == "enum":
             name = schema["name"]
-            fo.write(f'{{"name":"{name}","type":"{schema_type}","symbols":[')
-
-            for idx, symbol in enumerate(schema["symbols"]):
-                if idx != 0:
-                    fo.write(",")
-                fo.write(f'"{symbol}"')
-            fo.write("]}")
+            symbols = ",".join([f'"{symbol}"' for symbol in schema["symbols"]])
+            fo.write(
+                f'{{"name":"{name}","type":"{schema_type}","symbols":[{symbols}]}}'
+            )
 
         elif schema_type == "fixed":
             name = schema["name"]
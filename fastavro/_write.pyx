@@ -9,7 +9,7 @@
 from cpython cimport array
 import array
 import json
-from binascii import crc32
+from zlib import crc32
 from os import urandom
 import bz2
 import lzma
@@ -20,7 +20,7 @@ from warnings import warn
 from fastavro import const
 from ._logical_writers import LOGICAL_WRITERS
 from ._validation import _validate
-from ._read import HEADER_SCHEMA, SYNC_SIZE, MAGIC, reader
+from ._read import SYNC_SIZE, MAGIC, reader
 from ._schema import extract_record_type, extract_logical_type, parse_schema
 from ._write_common import _is_appendable
 
@@ -57,14 +57,15 @@ cdef inline write_int(bytearray fo, long64 datum):
     """int and long values are written using variable-length, zig-zag coding.
     """
     cdef ulong64 n
-    cdef unsigned char ch_temp[1]
+    cdef unsigned char ch_temp[10]
+    cdef int i = 0
     n = (datum << 1) ^ (datum >> 63)
     while (n & ~0x7F) != 0:
-        ch_temp[0] = (n & 0x7f) | 0x80
-        fo += ch_temp[:1]
+        ch_temp[i] = (n & 0x7f) | 0x80
+        i += 1
         n >>= 7
-    ch_temp[0] = n
-    fo += ch_temp[:1]
+    ch_temp[i] = n
+    fo += ch_temp[:i + 1]
 
 
 cdef inline write_long(bytearray fo, datum):
@@ -134,7 +135,7 @@ cdef inline write_utf8(bytearray fo, datum):
     fo += b_datum
 
 
-cdef inline write_crc32(bytearray fo, bytes bytes):
+cdef inline write_crc32(bytearray fo, object bytes):
     """A 4-byte, big-endian CRC32 checksum"""
     cdef unsigned char ch_temp[4]
     cdef uint32 data = crc32(bytes) & 0xFFFFFFFF
@@ -274,6 +275,10 @@ cdef write_union(bytearray fo, datum, schema, dict named_schemas, fname, dict op
             )
             raise ValueError(msg)
         index = best_match_index
+    elif datum is None and "null" in schema:
+        # None can only ever match the null branch so skip validating
+        # against every candidate
+        index = schema.index("null")
     else:
         pytype = type(datum)
         most_fields = -1
@@ -321,11 +326,10 @@ cdef write_union(bytearray fo, datum, schema, dict named_schemas, fname, dict op
                         if prepare:
                             datum = prepare(datum, candidate)
 
-                    candidate_fields = set(
-                        f["name"] for f in candidate["fields"]
-                    )
-                    datum_fields = set(datum)
-                    fields = len(candidate_fields.intersection(datum_fields))
+                    fields = 0
+                    for f in candidate["fields"]:
+                        if f["name"] in datum:
+                            fields += 1
                     if fields > most_fields:
                         best_match_index = index
                         most_fields = fields
@@ -476,15 +480,19 @@ cpdef write_data(bytearray fo, datum, schema, dict named_schemas, fname, dict op
 
 
 cpdef write_header(bytearray fo, dict metadata, bytes sync_marker):
-    header = {
-        "magic": MAGIC,
-        "meta": {key: value.encode() for key, value in metadata.items()},
-        "sync": sync_marker
-    }
-    write_data(fo, header, HEADER_SCHEMA, {}, "", {})
+    """The header layout is fixed (see HEADER_SCHEMA) so it is encoded
+    directly rather than going through the generic write_data machinery."""
+    fo += MAGIC
+    if len(metadata) > 0:
+        write_long(fo, len(metadata))
+        for key, value in metadata.items():
+            write_utf8(fo, key)
+            write_utf8(fo, value)
+    write_long(fo, 0)
+    fo += sync_marker
 
 
-cpdef null_write_block(object fo, bytes block_bytes, compression_level):
+cpdef null_write_block(object fo, object block_bytes, compression_level):
     """Write block in "null" codec."""
     cdef bytearray tmp = bytearray()
     write_long(tmp, len(block_bytes))
@@ -492,7 +500,7 @@ cpdef null_write_block(object fo, bytes block_bytes, compression_level):
     fo.write(block_bytes)
 
 
-cpdef deflate_write_block(object fo, bytes block_bytes, compression_level):
+cpdef deflate_write_block(object fo, object block_bytes, compression_level):
     """Write block in "deflate" codec."""
     cdef bytearray tmp = bytearray()
     # The first two characters and last character are zlib
@@ -507,7 +515,7 @@ cpdef deflate_write_block(object fo, bytes block_bytes, compression_level):
     fo.write(data)
 
 
-cpdef bzip2_write_block(object fo, bytes block_bytes, compression_level):
+cpdef bzip2_write_block(object fo, object block_bytes, compression_level):
     """Write block in "bzip2" codec."""
     cdef bytearray tmp = bytearray()
     data = bz2.compress(block_bytes)
@@ -516,7 +524,7 @@ cpdef bzip2_write_block(object fo, bytes block_bytes, compression_level):
     fo.write(data)
 
 
-cpdef xz_write_block(object fo, bytes block_bytes, compression_level):
+cpdef xz_write_block(object fo, object block_bytes, compression_level):
     """Write block in "xz" codec."""
     cdef bytearray tmp = bytearray()
     data = lzma.compress(block_bytes)
@@ -557,7 +565,7 @@ except ImportError:
         BLOCK_WRITERS["snappy"] = _missing_dependency("snappy", "cramjam")
 
 
-cpdef snappy_write_block(object fo, bytes block_bytes, compression_level):
+cpdef snappy_write_block(object fo, object block_bytes, compression_level):
     """Write block in "snappy" codec."""
     cdef bytearray tmp = bytearray()
     data = snappy_compress(block_bytes)
@@ -580,7 +588,7 @@ except ImportError:
     BLOCK_WRITERS["zstandard"] = _missing_dependency("zstandard", "zstandard")
 
 
-cpdef zstandard_write_block(object fo, bytes block_bytes, compression_level):
+cpdef zstandard_write_block(object fo, object block_bytes, compression_level):
     """Write block in "zstandard" codec."""
     cdef bytearray tmp = bytearray()
     if compression_level is not None:
@@ -602,7 +610,7 @@ except ImportError:
     BLOCK_WRITERS["lz4"] = _missing_dependency("lz4", "lz4")
 
 
-cpdef lz4_write_block(object fo, bytes block_bytes, compression_level):
+cpdef lz4_write_block(object fo, object block_bytes, compression_level):
     """Write block in "lz4" codec."""
     cdef bytearray tmp = bytearray()
     data = lz4.block.compress(block_bytes)
@@ -614,6 +622,18 @@ cpdef lz4_write_block(object fo, bytes block_bytes, compression_level):
 if BLOCK_WRITERS.get("lz4") is None:
     BLOCK_WRITERS["lz4"] = lz4_write_block
 
+# Block writers that only read the pending block while compressing it, so they
+# are handed the block buffer itself. Any other writer, including "null" which
+# passes the block on to the output file, gets a copy it is free to keep.
+_BUFFER_BLOCK_WRITERS = {
+    deflate_write_block,
+    bzip2_write_block,
+    xz_write_block,
+    snappy_write_block,
+    zstandard_write_block,
+    lz4_write_block,
+}
+
 
 cdef class MemoryIO:
     cdef bytearray value
@@ -727,7 +747,10 @@ cdef class Writer:
         cdef bytearray tmp = bytearray()
         write_long(tmp, self.block_count)
         self.fo.write(tmp)
-        self.block_writer(self.fo, self.io.getvalue(), self.compression_level)
+        if self.block_writer in _BUFFER_BLOCK_WRITERS:
+            self.block_writer(self.fo, self.io.value, self.compression_level)
+        else:
+            self.block_writer(self.fo, self.io.getvalue(), self.compression_level)
         self.fo.write(self.sync_marker)
         self.io.clear()
         self.block_count = 0
@@ -18,7 +18,7 @@ from .const import NAMED_TYPES
 from .io.binary_encoder import BinaryEncoder
 from .io.json_encoder import AvroJSONEncoder
 from .validation import _validate
-from .read import HEADER_SCHEMA, SYNC_SIZE, MAGIC, reader
+from .read import SYNC_SIZE, MAGIC, reader
 from .logical_writers import LOGICAL_WRITERS
 from .schema import extract_record_type, extract_logical_type, parse_schema
 from ._write_common import _is_appendable
@@ -140,7 +140,7 @@ def write_union(encoder, datum, schema, named_schemas, fname, options):
 
     best_match_index = -1
     if isinstance(datum, tuple) and not options.get("disable_tuple_notation"):
-        (name, datum) = datum
+        name, datum = datum
         for index, candidate in enumerate(schema):
             extracted_type = extract_record_type(candidate)
             if extracted_type in NAMED_TYPES:
@@ -159,6 +159,10 @@ def write_union(encoder, datum, schema, named_schemas, fname, options):
             )
             raise ValueError(msg)
         index = best_match_index
+    elif datum is None and "null" in schema:
+        # None can only ever match the null branch so skip validating
+        # against every candidate
+        index = schema.index("null")
     else:
         pytype = type(datum)
         most_fields = -1
@@ -205,9 +209,10 @@ def write_union(encoder, datum, schema, named_schemas, fname, options):
                         if prepare:
                             datum = prepare(datum, candidate)
 
-                    candidate_fields = set(f["name"] for f in candidate["fields"])
-                    datum_fields = set(datum)
-                    fields = len(candidate_fields.intersection(datum_fields))
+                    fields = 0
+                    for f in candidate["fields"]:
+                        if f["name"] in datum:
+                            fields += 1
                     if fields > most_fields:
                         best_match_index = index
                         most_fields = fields
@@ -325,12 +330,17 @@ def write_data(encoder, datum, schema, named_schemas, fname, options):
 
 
 def write_header(encoder, metadata, sync_marker):
-    header = {
-        "magic": MAGIC,
-        "meta": {key: value.encode() for key, value in metadata.items()},
-        "sync": sync_marker,
-    }
-    write_data(encoder, header, HEADER_SCHEMA, {}, "", {})
+    """The header layout is fixed (see HEADER_SCHEMA) so it is encoded
+    directly rather than going through the generic write_data machinery."""
+    encoder.write_fixed(MAGIC)
+    encoder.write_map_start()
+    if len(metadata) > 0:
+        encoder.write_item_count(len(metadata))
+        for key, value in metadata.items():
+            encoder.write_utf8(key)
+            encoder.write_utf8(value)
+    encoder.write_map_end()
+    encoder.write_fixed(sync_marker)
 
 
 def null_write_block(encoder, block_bytes, compression_level):
@@ -444,6 +454,18 @@ except ImportError:
 else:
     BLOCK_WRITERS["lz4"] = lz4_write_block
 
+# Block writers that only read the pending block while compressing it, so they
+# are handed the block buffer itself. Any other writer, including "null" which
+# passes the block on to the output file, gets a copy it is free to keep.
+_BUFFER_BLOCK_WRITERS = {
+    deflate_write_block,
+    bzip2_write_block,
+    xz_write_block,
+    snappy_write_block,
+    zstandard_write_block,
+    lz4_write_block,
+}
+
 
 class GenericWriter(ABC):
     def __init__(self, schema, metadata=None, validator=None, options={}):
@@ -547,7 +569,13 @@ class Writer(GenericWriter):
 
     def dump(self):
         self.encoder.write_long(self.block_count)
-        self.block_writer(self.encoder, self.io._fo.getvalue(), self.compression_level)
+        if self.block_writer in _BUFFER_BLOCK_WRITERS:
+            with self.io._fo.getbuffer() as block_bytes:
+                self.block_writer(self.encoder, block_bytes, self.compression_level)
+        else:
+            self.block_writer(
+                self.encoder, self.io._fo.getvalue(), self.compression_level
+            )
         self.encoder._fo.write(self.sync_marker)
         self.io._fo.truncate(0)
         self.io._fo.seek(0, SEEK_SET)
@@ -1,4 +1,7 @@
-from struct import unpack
+from struct import Struct
+
+_F32 = Struct("<f")
+_F64 = Struct("<d")
 
 
 class BinaryDecoder:
@@ -28,7 +31,10 @@ class BinaryDecoder:
 
         # technically 0x01 == true and 0x00 == false, but many languages will
         # cast anything other than 0 to True and only 0 to False
-        return unpack("B", self.fo.read(1))[0] != 0
+        c = self.fo.read(1)
+        if not c:
+            raise EOFError
+        return c != b"\x00"
 
     def read_long(self):
         """int and long values are written using variable-length, zig-zag
@@ -58,7 +64,7 @@ class BinaryDecoder:
         The float is converted into a 32-bit integer using a method equivalent
         to Java's floatToIntBits and then encoded in little-endian format.
         """
-        return unpack("<f", self.fo.read(4))[0]
+        return _F32.unpack(self.fo.read(4))[0]
 
     def read_double(self):
         """A double is written as 8 bytes.
@@ -66,7 +72,7 @@ class BinaryDecoder:
         The double is converted into a 64-bit integer using a method equivalent
         to Java's doubleToLongBits and then encoded in little-endian format.
         """
-        return unpack("<d", self.fo.read(8))[0]
+        return _F64.unpack(self.fo.read(8))[0]
 
     def read_bytes(self):
         """Bytes are encoded as a long followed by that many bytes of data."""
@@ -80,7 +86,12 @@ class BinaryDecoder:
         """A string is encoded as a long followed by that many bytes of UTF-8
         encoded character data.
         """
-        return self.read_bytes().decode(errors=handle_unicode_errors)
+        # Same as read_bytes, inlined since strings are so common
+        size = self.read_long()
+        out = self.fo.read(size)
+        if len(out) != size:
+            raise EOFError(f"Expected {size} bytes, read {len(out)}")
+        return out.decode(errors=handle_unicode_errors)
 
     def read_fixed(self, size):
         """Fixed instances are encoded using the number of bytes declared in the
@@ -90,11 +101,9 @@ class BinaryDecoder:
             raise EOFError(f"Expected {size} bytes, read {len(out)}")
         return out
 
-    def read_enum(self):
-        """An enum is encoded by a int, representing the zero-based position of the
-        symbol in the schema.
-        """
-        return self.read_long()
+    # An enum is encoded by a int, representing the zero-based position of the
+    # symbol in the schema.
+    read_enum = read_long
 
     def read_array_start(self):
         """Arrays are encoded as a series of blocks."""
@@ -133,10 +142,98 @@ class BinaryDecoder:
     def read_map_end(self):
         pass
 
-    def read_index(self):
-        """A union is encoded by first writing a long value indicating the
-        zero-based position within the union of the schema of its value.
+    # A union is encoded by first writing a long value indicating the
+    # zero-based position within the union of the schema of its value.
+    #
+    # The value is then encoded per the indicated schema within the union.
+    read_index = read_long
 
-        The value is then encoded per the indicated schema within the union.
-        """
-        return self.read_long()
+
+class BytesDecoder(BinaryDecoder):
+    """Decoder for the avro binary format held in an in-memory buffer.
+
+    Reading one byte at a time through a file-like object is comparatively
+    slow, so this decodes directly from the buffer's bytes and only keeps
+    track of the current position.
+
+    NOTE: All attributes and methods on this class should be considered
+    private.
+
+    Parameters
+    ----------
+    fo: BytesIO
+        Input buffer. Its position is not advanced while decoding.
+
+    """
+
+    def __init__(self, fo):
+        self.fo = fo
+        self._data = fo.getvalue()
+        self._pos = fo.tell()
+
+    def read_boolean(self):
+        pos = self._pos
+        try:
+            b = self._data[pos]
+        except IndexError:
+            raise EOFError
+        self._pos = pos + 1
+        return b != 0
+
+    def read_long(self):
+        data = self._data
+        pos = self._pos
+        try:
+            b = data[pos]
+            n = b & 0x7F
+            shift = 7
+            pos += 1
+            while (b & 0x80) != 0:
+                b = data[pos]
+                n |= (b & 0x7F) << shift
+                shift += 7
+                pos += 1
+        except IndexError:
+            raise EOFError
+        self._pos = pos
+        return (n >> 1) ^ -(n & 1)
+
+    read_int = read_long
+    read_enum = read_long
+    read_index = read_long
+
+    def read_float(self):
+        pos = self._pos
+        self._pos = pos + 4
+        return _F32.unpack_from(self._data, pos)[0]
+
+    def read_double(self):
+        pos = self._pos
+        self._pos = pos + 8
+        return _F64.unpack_from(self._data, pos)[0]
+
+    def read_fixed(self, size):
+        pos = self._pos
+        out = self._data[pos : pos + size]
+        if len(out) < size:
+            raise EOFError(f"Expected {size} bytes, read {len(out)}")
+        self._pos = pos + size
+        return out
+
+    def read_bytes(self):
+        size = self.read_long()
+        pos = self._pos
+        out = self._data[pos : pos + size]
+        if len(out) != size:
+            raise EOFError(f"Expected {size} bytes, read {len(out)}")
+        self._pos = pos + size
+        return out
+
+    def read_utf8(self, handle_unicode_errors="strict"):
+        size = self.read_long()
+        pos = self._pos
+        out = self._data[pos : pos + size]
+        if len(out) != size:
+            raise EOFError(f"Expected {size} bytes, read {len(out)}")
+        self._pos = pos + size
+        return out.decode(errors=handle_unicode_errors)
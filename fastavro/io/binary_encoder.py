@@ -1,5 +1,10 @@
-from struct import pack
-from binascii import crc32
+from struct import Struct
+from zlib import crc32
+
+_U8 = Struct("B")
+_U32BE = Struct(">I")
+_F32 = Struct("<f")
+_F64 = Struct("<d")
 
 
 class BinaryEncoder:
@@ -25,22 +30,29 @@ class BinaryEncoder:
         pass
 
     def write_boolean(self, datum):
-        self._fo.write(pack("B", 1 if datum else 0))
+        self._fo.write(_U8.pack(1 if datum else 0))
 
     def write_int(self, datum):
         datum = (datum << 1) ^ (datum >> 63)
+        if (datum & ~0x7F) == 0:
+            self._fo.write(_U8.pack(datum))
+            return
+
+        # Collect the bytes of longer varints so they take a single write
+        buf = bytearray()
         while (datum & ~0x7F) != 0:
-            self._fo.write(pack("B", (datum & 0x7F) | 0x80))
+            buf.append((datum & 0x7F) | 0x80)
             datum >>= 7
-        self._fo.write(pack("B", datum))
+        buf.append(datum)
+        self._fo.write(buf)
 
     write_long = write_int
 
     def write_float(self, datum):
-        self._fo.write(pack("<f", datum))
+        self._fo.write(_F32.pack(datum))
 
     def write_double(self, datum):
-        self._fo.write(pack("<d", datum))
+        self._fo.write(_F64.pack(datum))
 
     def write_bytes(self, datum):
         self.write_long(len(datum))
@@ -55,7 +67,7 @@ class BinaryEncoder:
 
     def write_crc32(self, datum):
         data = crc32(datum) & 0xFFFFFFFF
-        self._fo.write(pack(">I", data))
+        self._fo.write(_U32BE.pack(data))
 
     def write_fixed(self, datum):
         self._fo.write(datum)
@@ -5,28 +5,45 @@ from .parser import Parser
 from .symbols import (
     RecordStart,
     FieldStart,
-    Boolean,
-    Int,
-    Null,
-    String,
-    Long,
-    Float,
-    Double,
-    Bytes,
+    BOOLEAN,
+    INT,
+    NULL,
+    STRING,
+    LONG,
+    FLOAT,
+    DOUBLE,
+    BYTES,
     FieldEnd,
     RecordEnd,
-    Union,
+    UNION,
     UnionEnd,
-    MapStart,
-    MapEnd,
+    MAP_START,
+    MAP_END,
     MapKeyMarker,
-    Fixed,
-    ArrayStart,
-    ArrayEnd,
-    Enum,
-    ItemEnd,
+    MAP_KEY_MARKER,
+    FIXED,
+    ARRAY_START,
+    ARRAY_END,
+    ENUM,
+    ITEM_END,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _loads(s):
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the json module (it rejects NaN,
+            # Infinity and lone surrogates) so give that a chance as well
+            pass
+    return json.loads(s)
+
 
 class AvroJSONDecoder:
     """Decoder for the avro JSON format.
@@ -44,13 +61,19 @@ class AvroJSONDecoder:
     def __init__(self, fo: IO):
         self._fo = fo
         self._stack: List[Tuple[Any, str]] = []
-        self._json_data = [json.loads(line.strip()) for line in fo]
-        if self._json_data:
-            self._current = self._json_data.pop(0)
-            self.done = False
-        else:
-            self.done = True
+        # Records are one per line, so only decode them as they are needed
+        self._lines = iter(fo)
         self._key = None
+        self.done = False
+        self._load_next_record()
+
+    def _load_next_record(self):
+        line = next(self._lines, None)
+        if line is None:
+            self.done = True
+        else:
+            self._current = _loads(line.strip())
+            self._key = None
 
     def read_value(self, symbol):
         if isinstance(self._current, dict):
@@ -83,38 +106,37 @@ class AvroJSONDecoder:
         self._parser = Parser(schema, named_schemas, self.do_action)
 
     def do_action(self, action):
-        if isinstance(action, RecordStart):
-            self._push_and_adjust(action)
-        elif isinstance(action, RecordEnd):
-            self._pop()
-        elif isinstance(action, FieldStart):
+        # The action classes are never subclassed so compare types directly,
+        # with the per field actions first since they are the most common
+        action_type = type(action)
+        if action_type is FieldStart:
             self.read_object_key(action.field_name)
-        elif isinstance(action, FieldEnd) or isinstance(action, UnionEnd):
+        elif action_type is FieldEnd or action_type is UnionEnd:
             # TODO: Do we need a FieldEnd and UnionEnd symbol?
             pass
+        elif action_type is RecordStart:
+            self._push_and_adjust(action)
+        elif action_type is RecordEnd:
+            self._pop()
         else:
             raise Exception(f"cannot handle: {action}")
 
     def drain(self):
         self._parser.drain_actions()
-        if self._json_data:
-            self._current = self._json_data.pop(0)
-            self._key = None
-        else:
-            self.done = True
+        self._load_next_record()
 
     def read_null(self):
-        symbol = self._parser.advance(Null())
+        symbol = self._parser.advance(NULL)
         return self.read_value(symbol)
 
     def read_boolean(self):
-        symbol = self._parser.advance(Boolean())
+        symbol = self._parser.advance(BOOLEAN)
         return self.read_value(symbol)
 
     def read_utf8(self, handle_unicode_errors="strict"):
-        symbol = self._parser.advance(String())
-        if self._parser.stack[-1] == MapKeyMarker():
-            self._parser.advance(MapKeyMarker())
+        symbol = self._parser.advance(STRING)
+        if type(self._parser.stack[-1]) is MapKeyMarker:
+            self._parser.advance(MAP_KEY_MARKER)
             for key in self._current:
                 self._key = key
                 break
@@ -123,38 +145,38 @@ class AvroJSONDecoder:
             return self.read_value(symbol)
 
     def read_bytes(self):
-        symbol = self._parser.advance(Bytes())
+        symbol = self._parser.advance(BYTES)
         return self.read_value(symbol).encode("iso-8859-1")
 
     def read_int(self):
-        symbol = self._parser.advance(Int())
+        symbol = self._parser.advance(INT)
         return self.read_value(symbol)
 
     def read_long(self):
-        symbol = self._parser.advance(Long())
+        symbol = self._parser.advance(LONG)
         return self.read_value(symbol)
 
     def read_float(self):
-        symbol = self._parser.advance(Float())
+        symbol = self._parser.advance(FLOAT)
         return self.read_value(symbol)
 
     def read_double(self):
-        symbol = self._parser.advance(Double())
+        symbol = self._parser.advance(DOUBLE)
         return self.read_value(symbol)
 
     def read_enum(self):
-        symbol = self._parser.advance(Enum())
+        symbol = self._parser.advance(ENUM)
         enum_labels = self._parser.pop_symbol()  # pop the enumlabels
         # TODO: Should we verify the value is one of the symbols?
         label = self.read_value(symbol)
-        return enum_labels.labels.index(label)
+        return enum_labels.get_index(label)
 
     def read_fixed(self, size):
-        symbol = self._parser.advance(Fixed())
+        symbol = self._parser.advance(FIXED)
         return self.read_value(symbol).encode("iso-8859-1")
 
     def read_map_start(self):
-        symbol = self._parser.advance(MapStart())
+        symbol = self._parser.advance(MAP_START)
         self._push_and_adjust(symbol)
 
     def read_object_key(self, key):
@@ -170,16 +192,16 @@ class AvroJSONDecoder:
             del self._current[key]
 
     def read_map_end(self):
-        self._parser.advance(MapEnd())
+        self._parser.advance(MAP_END)
         self._pop()
 
     def read_array_start(self):
-        symbol = self._parser.advance(ArrayStart())
+        symbol = self._parser.advance(ARRAY_START)
         self._push_and_adjust(symbol)
         self._key = None
 
     def read_array_end(self):
-        self._parser.advance(ArrayEnd())
+        self._parser.advance(ARRAY_END)
         self._pop()
 
     def iter_array(self):
@@ -188,10 +210,10 @@ class AvroJSONDecoder:
             self._current = self._current.pop(0)
             yield
             self._pop()
-            self._parser.advance(ItemEnd())
+            self._parser.advance(ITEM_END)
 
     def read_index(self):
-        self._parser.advance(Union())
+        self._parser.advance(UNION)
         alternative_symbol = self._parser.pop_symbol()
 
         # TODO: Try to clean this up.
@@ -223,7 +245,7 @@ class AvroJSONDecoder:
                 # TODO: Do we need to do this?
                 self._parser.push_symbol(UnionEnd())
 
-        index = alternative_symbol.labels.index(label)
+        index = alternative_symbol.get_index(label)
         symbol = alternative_symbol.get_symbol(index)
         self._parser.push_symbol(symbol)
         return index
@@ -4,28 +4,30 @@ from typing import IO, List, Tuple, Any
 from .parser import Parser
 from .symbols import (
     Root,
-    Boolean,
-    Int,
+    BOOLEAN,
+    INT,
     RecordStart,
     RecordEnd,
     FieldStart,
     FieldEnd,
     Null,
-    String,
-    Union,
+    NULL,
+    STRING,
+    UNION,
     UnionEnd,
-    Long,
-    Float,
-    Double,
-    Bytes,
-    MapStart,
-    MapEnd,
+    LONG,
+    FLOAT,
+    DOUBLE,
+    BYTES,
+    MAP_START,
+    MAP_END,
     MapKeyMarker,
-    Enum,
-    Fixed,
-    ArrayStart,
-    ArrayEnd,
-    ItemEnd,
+    MAP_KEY_MARKER,
+    ENUM,
+    FIXED,
+    ARRAY_START,
+    ARRAY_END,
+    ITEM_END,
 )
 
 
@@ -49,7 +51,7 @@ class AvroJSONEncoder:
         self._stack: List[Tuple[Any, str]] = []
         self._current = None
         self._key = None
-        self._records: List[Any] = []
+        self._records: List[str] = []
         self._write_union_type = write_union_type
 
     def write_value(self, value):
@@ -63,7 +65,7 @@ class AvroJSONEncoder:
         else:
             # If we aren't in a dict or a list then this must be a schema which
             # just has a single basic type
-            self._records.append(value)
+            self._records.append(json.dumps(value))
 
     def _push(self):
         self._stack.append((self._current, self._key))
@@ -79,15 +81,16 @@ class AvroJSONEncoder:
         else:
             assert prev_current is None
             assert prev_key is None
-            # Back at None, we should have a full record in self._current
-            self._records.append(self._current)
+            # Back at None, we should have a full record in self._current.
+            # Serialize it right away so only its JSON is held until the
+            # buffer is written out
+            self._records.append(json.dumps(self._current))
             self._current = prev_current
             self._key = prev_key
 
     def write_buffer(self):
         # Newline separated
-        json_data = "\n".join([json.dumps(record) for record in self._records])
-        self._fo.write(json_data)
+        self._fo.write("\n".join(self._records))
 
     def configure(self, schema, named_schemas):
         self._parser = Parser(schema, named_schemas, self.do_action)
@@ -96,68 +99,71 @@ class AvroJSONEncoder:
         self._parser.flush()
 
     def do_action(self, action):
-        if isinstance(action, RecordStart):
-            self.write_object_start()
-        elif isinstance(action, RecordEnd) or isinstance(action, UnionEnd):
-            self.write_object_end()
-        elif isinstance(action, FieldStart):
+        # The action classes are never subclassed so compare types directly,
+        # with the per field actions first since they are the most common
+        action_type = type(action)
+        if action_type is FieldStart:
             self.write_object_key(action.field_name)
-        elif isinstance(action, FieldEnd):
+        elif action_type is FieldEnd:
             # TODO: Do we need a FieldEnd symbol?
             pass
-        elif isinstance(action, Root):
+        elif action_type is RecordStart:
+            self.write_object_start()
+        elif action_type is RecordEnd or action_type is UnionEnd:
+            self.write_object_end()
+        elif action_type is Root:
             self.write_buffer()
         else:
             raise Exception(f"Internal Exception: {action}")
 
     def write_null(self):
-        self._parser.advance(Null())
+        self._parser.advance(NULL)
         self.write_value(None)
 
     def write_boolean(self, value):
-        self._parser.advance(Boolean())
+        self._parser.advance(BOOLEAN)
         self.write_value(value)
 
     def write_utf8(self, value):
-        self._parser.advance(String())
-        if self._parser.stack[-1] == MapKeyMarker():
-            self._parser.advance(MapKeyMarker())
+        self._parser.advance(STRING)
+        if type(self._parser.stack[-1]) is MapKeyMarker:
+            self._parser.advance(MAP_KEY_MARKER)
             self.write_object_key(value)
         else:
             self.write_value(value)
 
     def write_int(self, value):
-        self._parser.advance(Int())
+        self._parser.advance(INT)
         self.write_value(value)
 
     def write_long(self, value):
-        self._parser.advance(Long())
+        self._parser.advance(LONG)
         self.write_value(value)
 
     def write_float(self, value):
-        self._parser.advance(Float())
+        self._parser.advance(FLOAT)
         self.write_value(value)
 
     def write_double(self, value):
-        self._parser.advance(Double())
+        self._parser.advance(DOUBLE)
         self.write_value(value)
 
     def write_bytes(self, value):
-        self._parser.advance(Bytes())
+        self._parser.advance(BYTES)
         self.write_value(value.decode("iso-8859-1"))
 
     def write_enum(self, index):
-        self._parser.advance(Enum())
+        self._parser.advance(ENUM)
         enum_labels = self._parser.pop_symbol()
         # TODO: Check symbols?
         self.write_value(enum_labels.labels[index])
 
     def write_fixed(self, value):
-        self._parser.advance(Fixed())
+        self._parser.advance(FIXED)
         self.write_value(value.decode("iso-8859-1"))
 
     def write_array_start(self):
-        self._parser.advance(ArrayStart())
+        self._parser.advance(ARRAY_START)
         self._push()
         self._current = []
 
@@ -165,10 +171,10 @@ class AvroJSONEncoder:
         pass
 
     def end_item(self):
-        self._parser.advance(ItemEnd())
+        self._parser.advance(ITEM_END)
 
     def write_array_end(self):
-        self._parser.advance(ArrayEnd())
+        self._parser.advance(ARRAY_END)
         self._pop()
 
     def write_object_start(self):
@@ -182,20 +188,20 @@ class AvroJSONEncoder:
         self._pop()
 
     def write_map_start(self):
-        self._parser.advance(MapStart())
+        self._parser.advance(MAP_START)
         self.write_object_start()
 
     def write_map_end(self):
-        self._parser.advance(MapEnd())
+        self._parser.advance(MAP_END)
         self.write_object_end()
 
     def write_index(self, index, schema):
-        self._parser.advance(Union())
+        self._parser.advance(UNION)
         alternative_symbol = self._parser.pop_symbol()
 
         symbol = alternative_symbol.get_symbol(index)
 
-        if symbol != Null() and self._write_union_type:
+        if type(symbol) is not Null and self._write_union_type:
             self.write_object_start()
             self.write_object_key(alternative_symbol.get_label(index))
             # TODO: Do we need this symbol?
@@ -1,10 +1,8 @@
 from .symbols import (
     Root,
-    Terminal,
     Boolean,
     Sequence,
     Repeater,
-    Action,
     RecordStart,
     RecordEnd,
     FieldStart,
@@ -28,31 +26,52 @@ from .symbols import (
     ArrayEnd,
     ItemEnd,
     NO_DEFAULT,
+    _splice_sequences,
+    ACTION,
+    TERMINAL,
+    REPEATER,
+    ROOT,
 )
 from ..schema import extract_record_type
 
+# Types that are a single terminal symbol, other than null which never takes a
+# default
+_TERMINALS = {
+    "boolean": Boolean,
+    "string": String,
+    "bytes": Bytes,
+    "int": Int,
+    "long": Long,
+    "float": Float,
+    "double": Double,
+    "fixed": Fixed,
+}
+
 
 class Parser:
     def __init__(self, schema, named_schemas, action_function):
         self.schema = schema
-        self._processed_records = []
+        self._processed_records = set()
+        self._named_symbols = {}
         self.named_schemas = named_schemas
         self.action_function = action_function
         self.stack = self.parse()
 
     def parse(self):
         symbol = self._parse(self.schema)
-        root = Root([symbol])
+        root = Root(_splice_sequences([symbol]))
         root.production.insert(0, root)
         return [root, symbol]
 
     def _process_record(self, schema, default, schema_name=None):
+        # Symbols are collected in the order they are read and reversed at the
+        # end since the parser pops them off the end of its stack
         production = []
 
         production.append(RecordStart(default=default))
         for field in schema["fields"]:
             field_name = field["name"]
-            production.insert(0, FieldStart(field_name))
+            production.append(FieldStart(field_name))
 
             if schema_name is not None and schema_name in field["type"]:
                 # this meanns a recursive relationship, so we force a `null`
@@ -64,21 +83,25 @@ class Parser:
                     field["type"], field.get("default", NO_DEFAULT)
                 )
 
-            production.insert(0, internal_record)
-            production.insert(0, FieldEnd())
-        production.insert(0, RecordEnd())
+            production.append(internal_record)
+            production.append(FieldEnd())
+        production.append(RecordEnd())
 
+        production.reverse()
         return production
 
     def _parse(self, schema, default=NO_DEFAULT):
         record_type = extract_record_type(schema)
 
-        if record_type == "record":
+        terminal = _TERMINALS.get(record_type)
+        if terminal is not None:
+            return terminal(default=default)
+        elif record_type == "record":
             production = []
             schema_name = schema["name"]
 
             if schema_name not in self._processed_records:
-                self._processed_records.append(schema_name)
+                self._processed_records.add(schema_name)
                 production = self._process_record(schema, default)
             else:
                 production = self._process_record(
@@ -94,9 +117,10 @@ class Parser:
             for candidate_schema in schema:
                 symbols.append(self._parse(candidate_schema))
                 if isinstance(candidate_schema, dict):
-                    labels.append(
-                        candidate_schema.get("name", candidate_schema.get("type"))
-                    )
+                    name = candidate_schema.get("name")
+                    if name is None:
+                        name = candidate_schema["type"]
+                    labels.append(name)
                 else:
                     labels.append(candidate_schema)
 
@@ -125,53 +149,59 @@ class Parser:
 
         elif record_type == "null":
             return Null()
-        elif record_type == "boolean":
-            return Boolean(default=default)
-        elif record_type == "string":
-            return String(default=default)
-        elif record_type == "bytes":
-            return Bytes(default=default)
-        elif record_type == "int":
-            return Int(default=default)
-        elif record_type == "long":
-            return Long(default=default)
-        elif record_type == "float":
-            return Float(default=default)
-        elif record_type == "double":
-            return Double(default=default)
-        elif record_type == "fixed":
-            return Fixed(default=default)
         elif record_type in self.named_schemas:
-            return self._parse(self.named_schemas[record_type])
+            # Resolving a name gives the same symbols every time, except for
+            # the first time a record is seen since later ones stop at recursive
+            # fields, so the symbols can be shared between the references
+            symbol = self._named_symbols.get(record_type)
+            if symbol is None:
+                named_schema = self.named_schemas[record_type]
+                reusable = (
+                    record_type in self._processed_records
+                    or extract_record_type(named_schema) != "record"
+                )
+                symbol = self._parse(named_schema)
+                if reusable:
+                    self._named_symbols[record_type] = symbol
+            return symbol
         else:
             raise Exception(f"Unhandled type: {record_type}")
 
     def advance(self, symbol):
+        # Symbols are told apart by their class alone, so compare the types
+        # directly rather than going through Symbol.__eq__ for every symbol
+        symbol_type = type(symbol)
+        stack = self.stack
         while True:
-            top = self.stack.pop()
+            top = stack.pop()
 
-            if top == symbol:
+            if type(top) is symbol_type:
                 return top
-            elif isinstance(top, Action):
+
+            kind = top.KIND
+            if kind == ACTION:
                 self.action_function(top)
-            elif isinstance(top, Terminal):
+            elif kind == TERMINAL:
                 raise Exception(f"Internal Parser Exception: {top}")
-            elif isinstance(top, Repeater) and top.end == symbol:
+            elif kind == REPEATER and type(top.end) is symbol_type:
                 return symbol
             else:
-                self.stack.extend(top.production)
+                stack.extend(top.production)
 
     def drain_actions(self):
+        stack = self.stack
+        action_function = self.action_function
         while True:
-            top = self.stack.pop()
+            top = stack.pop()
 
-            if isinstance(top, Root):
-                self.push_symbol(top)
+            kind = top.KIND
+            if kind == ROOT:
+                stack.append(top)
                 break
-            elif isinstance(top, Action):
-                self.action_function(top)
-            elif not isinstance(top, Terminal):
-                self.stack.extend(top.production)
+            elif kind == ACTION:
+                action_function(top)
+            elif kind != TERMINAL:
+                stack.extend(top.production)
             else:
                 raise Exception(f"Internal Parser Exception: {top}")
 
@@ -182,10 +212,13 @@ class Parser:
         self.stack.append(symbol)
 
     def flush(self):
-        while len(self.stack) > 0:
-            top = self.stack.pop()
-
-            if isinstance(top, Action) or isinstance(top, Root):
-                self.action_function(top)
+        stack = self.stack
+        action_function = self.action_function
+        while stack:
+            top = stack.pop()
+
+            kind = top.KIND
+            if kind == ACTION or kind == ROOT:
+                action_function(top)
             else:
                 raise Exception(f"Internal Parser Exception: {top}")
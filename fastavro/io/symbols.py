@@ -1,69 +1,138 @@
 class _NoDefault:
-    pass
+    __slots__ = ()
 
 
 NO_DEFAULT = _NoDefault()
 
+# The kind of a symbol tells the parser how to handle it when it comes off the
+# stack without having to go through a series of isinstance checks
+NONTERMINAL = 0
+ACTION = 1
+TERMINAL = 2
+REPEATER = 3
+ROOT = 4
+
 
 class Symbol:
+    __slots__ = ("production", "default")
+
+    KIND = NONTERMINAL
+
     def __init__(self, production=None, default=NO_DEFAULT):
         self.production = production
         self.default = default
 
     def get_default(self):
-        if self.default == NO_DEFAULT:
+        if self.default is NO_DEFAULT:
             raise ValueError("no value and no default")
         else:
             return self.default
 
     def __eq__(self, other):
-        return self.__class__ == other.__class__
+        return type(self) is type(other)
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
 
 class Root(Symbol):
-    pass
-
-
-class Terminal(Symbol):
-    pass
-
-
-Null = type("Null", (Terminal,), {})
-Boolean = type("Boolean", (Terminal,), {})
-String = type("String", (Terminal,), {})
-Bytes = type("Bytes", (Terminal,), {})
-Int = type("Int", (Terminal,), {})
-Long = type("Long", (Terminal,), {})
-Float = type("Float", (Terminal,), {})
-Double = type("Double", (Terminal,), {})
-Fixed = type("Fixed", (Terminal,), {})
+    __slots__ = ()
 
-Union = type("Union", (Terminal,), {})
+    KIND = ROOT
 
-MapEnd = type("MapEnd", (Terminal,), {})
-MapStart = type("MapStart", (Terminal,), {})
-MapKeyMarker = type("MapKeyMarker", (Terminal,), {})
-ItemEnd = type("ItemEnd", (Terminal,), {})
 
-ArrayEnd = type("ArrayEnd", (Terminal,), {})
-ArrayStart = type("ArrayStart", (Terminal,), {})
-
-Enum = type("Enum", (Terminal,), {})
+class Terminal(Symbol):
+    __slots__ = ()
+
+    KIND = TERMINAL
+
+    def __new__(cls, production=None, default=NO_DEFAULT):
+        # A terminal without a default is fully described by its class, so
+        # every one of them shares a single instance
+        if default is NO_DEFAULT:
+            instance = cls.__dict__.get("_shared")
+            if instance is None:
+                instance = super().__new__(cls)
+                cls._shared = instance
+            return instance
+        return super().__new__(cls)
+
+
+Null = type("Null", (Terminal,), {"__slots__": ()})
+Boolean = type("Boolean", (Terminal,), {"__slots__": ()})
+String = type("String", (Terminal,), {"__slots__": ()})
+Bytes = type("Bytes", (Terminal,), {"__slots__": ()})
+Int = type("Int", (Terminal,), {"__slots__": ()})
+Long = type("Long", (Terminal,), {"__slots__": ()})
+Float = type("Float", (Terminal,), {"__slots__": ()})
+Double = type("Double", (Terminal,), {"__slots__": ()})
+Fixed = type("Fixed", (Terminal,), {"__slots__": ()})
+
+Union = type("Union", (Terminal,), {"__slots__": ()})
+
+MapEnd = type("MapEnd", (Terminal,), {"__slots__": ()})
+MapStart = type("MapStart", (Terminal,), {"__slots__": ()})
+MapKeyMarker = type("MapKeyMarker", (Terminal,), {"__slots__": ()})
+ItemEnd = type("ItemEnd", (Terminal,), {"__slots__": ()})
+
+ArrayEnd = type("ArrayEnd", (Terminal,), {"__slots__": ()})
+ArrayStart = type("ArrayStart", (Terminal,), {"__slots__": ()})
+
+Enum = type("Enum", (Terminal,), {"__slots__": ()})
+
+# The terminals the encoders and decoders advance the parser with. Creating a
+# new one for every value would be wasted work since they are all the same.
+NULL = Null()
+BOOLEAN = Boolean()
+STRING = String()
+BYTES = Bytes()
+INT = Int()
+LONG = Long()
+FLOAT = Float()
+DOUBLE = Double()
+FIXED = Fixed()
+UNION = Union()
+MAP_END = MapEnd()
+MAP_START = MapStart()
+MAP_KEY_MARKER = MapKeyMarker()
+ITEM_END = ItemEnd()
+ARRAY_END = ArrayEnd()
+ARRAY_START = ArrayStart()
+ENUM = Enum()
+
+
+def _splice_sequences(symbols):
+    """Replace any sequence in symbols by the symbols it contains
+
+    A sequence only groups symbols, so its contents can be pushed onto the
+    parser stack directly instead of expanding the sequence at runtime every
+    time it is reached.
+    """
+    production = []
+    for symbol in symbols:
+        if type(symbol) is Sequence:
+            production.extend(symbol.production)
+        else:
+            production.append(symbol)
+    return production
 
 
 class Sequence(Symbol):
+    __slots__ = ()
+
     def __init__(self, *symbols, default=NO_DEFAULT):
-        super().__init__(list(symbols), default)
+        super().__init__(_splice_sequences(symbols), default)
 
 
 class Repeater(Symbol):
     """Arrays"""
 
+    __slots__ = ("end",)
+
+    KIND = REPEATER
+
     def __init__(self, end, *symbols, default=NO_DEFAULT):
-        super().__init__(list(symbols), default)
+        super().__init__(_splice_sequences(symbols), default)
         self.production.insert(0, self)
         self.end = end
 
@@ -71,9 +140,14 @@ class Repeater(Symbol):
 class Alternative(Symbol):
     """Unions"""
 
+    __slots__ = ("labels", "_label_indexes")
+
     def __init__(self, symbols, labels, default=NO_DEFAULT):
         super().__init__(symbols, default)
         self.labels = labels
+        self._label_indexes = {}
+        for index, label in enumerate(labels):
+            self._label_indexes.setdefault(label, index)
 
     def get_symbol(self, index):
         return self.production[index]
@@ -81,32 +155,53 @@ class Alternative(Symbol):
     def get_label(self, index):
         return self.labels[index]
 
+    def get_index(self, label):
+        try:
+            return self._label_indexes[label]
+        except KeyError:
+            raise ValueError(f"{label!r} is not one of the labels {self.labels}")
+
 
 class Action(Symbol):
-    pass
+    __slots__ = ()
+
+    KIND = ACTION
 
 
 class EnumLabels(Action):
+    __slots__ = ("labels", "_label_indexes")
+
     def __init__(self, labels):
         self.labels = labels
+        self._label_indexes = {}
+        for index, label in enumerate(labels):
+            self._label_indexes.setdefault(label, index)
+
+    def get_index(self, label):
+        try:
+            return self._label_indexes[label]
+        except KeyError:
+            raise ValueError(f"{label!r} is not one of the symbols {self.labels}")
 
 
 class UnionEnd(Action):
-    pass
+    __slots__ = ()
 
 
 class RecordStart(Action):
-    pass
+    __slots__ = ()
 
 
 class RecordEnd(Action):
-    pass
+    __slots__ = ()
 
 
 class FieldStart(Action):
+    __slots__ = ("field_name",)
+
     def __init__(self, field_name):
         self.field_name = field_name
 
 
 class FieldEnd(Action):
-    pass
+    __slots__ = ()
@@ -26,7 +26,8 @@ def json_reader(
         be given to allow for schema migration
     decoder
         By default the standard AvroJSONDecoder will be used, but a custom one
-        could be passed here
+        could be passed here. If `orjson` is installed the standard decoder
+        uses it to decode each line.
 
 
     Example::
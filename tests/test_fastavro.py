@@ -1,7 +1,8 @@
 from io import BytesIO
 import math
 import fastavro
-from fastavro.io.binary_decoder import BinaryDecoder
+from fastavro.io.binary_decoder import BinaryDecoder, BytesDecoder
+from fastavro import _read_py
 from fastavro.read import _read as _reader, HEADER_SCHEMA, SchemaResolutionError
 from fastavro.write import _write as _writer, Writer
 
@@ -338,6 +339,85 @@ def test_metadata():
     assert new_reader.metadata["key"] == metadata["key"]
 
 
+def test_header_encoding_matches_header_schema():
+    """The header is written directly rather than through HEADER_SCHEMA so
+    check that the two encodings agree"""
+    schema = {"type": "record", "name": "test_header", "fields": []}
+
+    new_file = BytesIO()
+    fastavro.writer(new_file, schema, [], metadata={"key": "value"})
+    new_file.seek(0)
+    header = fastavro.schemaless_reader(new_file, HEADER_SCHEMA)
+    assert header["meta"]["key"] == b"value"
+
+    expected = BytesIO()
+    fastavro.schemaless_writer(expected, HEADER_SCHEMA, header)
+    assert new_file.getvalue() == expected.getvalue()
+
+
+class RetainingIO(BytesIO):
+    """File-like object that keeps hold of everything passed to write()"""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+        return super().write(data)
+
+    def retained(self):
+        return b"".join(self.chunks)
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate"])
+def test_writer_output_does_not_change_after_write(codec):
+    schema = {
+        "type": "record",
+        "name": "test_writer_output_does_not_change_after_write",
+        "fields": [{"name": "field", "type": "string"}],
+    }
+    records = [{"field": str(i) * 10} for i in range(100)]
+
+    fo = RetainingIO()
+    fastavro.writer(fo, schema, records, codec=codec, sync_interval=100)
+    assert len(fo.chunks) > 10
+
+    assert list(fastavro.reader(BytesIO(fo.retained()))) == records
+
+
+def test_writer_schema_changes_do_not_leak_into_other_readers():
+    schema = {
+        "type": "record",
+        "name": "test_writer_schema_changes_do_not_leak",
+        "fields": [
+            {
+                "name": "inner",
+                "type": {
+                    "type": "record",
+                    "name": "Inner",
+                    "fields": [{"name": "field", "type": "string"}],
+                },
+            },
+            {"name": "other", "type": ["null", "Inner"]},
+        ],
+    }
+    records = [{"inner": {"field": "a"}, "other": {"field": "b"}}]
+
+    new_file = BytesIO()
+    fastavro.writer(new_file, schema, records)
+
+    new_file.seek(0)
+    first_reader = fastavro.reader(new_file)
+    first_reader.writer_schema["fields"].append({"name": "extra", "type": "long"})
+    first_reader.writer_schema["fields"][0]["type"]["fields"].clear()
+
+    new_file.seek(0)
+    second_reader = fastavro.reader(new_file)
+    assert second_reader.writer_schema is not first_reader.writer_schema
+    assert list(second_reader) == records
+
+
 def test_write_union_shortcut():
     schema = {
         "type": "record",
@@ -1365,6 +1445,66 @@ def test_eof_error_bytes():
         fastavro.schemaless_reader(new_file, schema)
 
 
+def test_eof_error_boolean():
+    decoder = BinaryDecoder(BytesIO())
+
+    with pytest.raises(EOFError):
+        decoder.read_boolean()
+
+
+def test_read_boolean_nonzero_byte_is_true():
+    assert BinaryDecoder(BytesIO(b"\x02")).read_boolean() is True
+    assert BinaryDecoder(BytesIO(b"\x00")).read_boolean() is False
+
+
+def test_reader_unicode_decode_errors():
+    schema = {
+        "type": "record",
+        "name": "test_reader_unicode_decode_errors",
+        "fields": [{"name": "field", "type": "string"}],
+    }
+    new_file = BytesIO()
+    fastavro.writer(new_file, schema, [{"field": "\u00e9foo"}])
+
+    # Swap the encoded "\u00e9" for two bytes that are not valid UTF-8
+    data = new_file.getvalue().replace(b"\xc3\xa9foo", b"\xa1\xa1foo")
+
+    with pytest.raises(UnicodeDecodeError):
+        list(fastavro.reader(BytesIO(data)))
+
+    records = list(fastavro.reader(BytesIO(data), handle_unicode_errors="replace"))
+    assert records == [{"field": "\ufffd\ufffdfoo"}]
+
+
+@pytest.mark.parametrize("field_type,value", [("string", "abc"), ("bytes", b"abc")])
+def test_reader_negative_length_is_eof_error(field_type, value):
+    schema = {
+        "type": "record",
+        "name": "test_reader_negative_length_is_eof_error",
+        "fields": [
+            {"name": "field", "type": field_type},
+            {"name": "other", "type": "int"},
+        ],
+    }
+    new_file = BytesIO()
+    fastavro.writer(new_file, schema, [{"field": value, "other": 1}])
+
+    # Corrupt the length of "abc" (zig-zag 3) into -3
+    data = new_file.getvalue().replace(b"\x06abc", b"\x05abc")
+
+    with pytest.raises(EOFError):
+        list(fastavro.reader(BytesIO(data)))
+
+    # Also when the field is skipped because the reader schema drops it
+    reader_schema = {
+        "type": "record",
+        "name": "test_reader_negative_length_is_eof_error",
+        "fields": [{"name": "other", "type": "int"}],
+    }
+    with pytest.raises(EOFError):
+        list(fastavro.reader(BytesIO(data), reader_schema))
+
+
 def test_write_union_tuple_uses_namespaced_name():
     """
     Test that we must use the fully namespaced name when we are using the tuple
@@ -2906,6 +3046,47 @@ def test_reading_with_skip_using_pure_python():
     assert roundtrip_records == [skip_record]
 
 
+def test_bytes_decoder_matches_binary_decoder():
+    schema = {
+        "type": "record",
+        "name": "test_bytes_decoder_matches_binary_decoder",
+        "fields": [
+            {"name": "boolean", "type": "boolean"},
+            {"name": "long", "type": "long"},
+            {"name": "float", "type": "float"},
+            {"name": "double", "type": "double"},
+            {"name": "bytes", "type": "bytes"},
+            {"name": "string", "type": "string"},
+            {"name": "fixed", "type": {"type": "fixed", "name": "f", "size": 3}},
+            {"name": "array", "type": {"type": "array", "items": "int"}},
+            {"name": "union", "type": ["null", "string"]},
+        ],
+    }
+    record = {
+        "boolean": True,
+        "long": -(2**40),
+        "float": 1.5,
+        "double": 2.25,
+        "bytes": b"\x00\x01",
+        "string": "ünicode",
+        "fixed": b"abc",
+        "array": [1, -2, 300],
+        "union": "value",
+    }
+    parsed_schema = fastavro.parse_schema(schema)
+    new_file = BytesIO()
+    fastavro.schemaless_writer(new_file, parsed_schema, record)
+
+    named_schemas = {"writer": {}, "reader": {}}
+    new_file.seek(0)
+    decoder = BytesDecoder(new_file)
+    assert _read_py.read_data(decoder, parsed_schema, named_schemas) == record
+
+    truncated = BytesIO(new_file.getvalue()[:-1])
+    with pytest.raises(EOFError):
+        _read_py.read_data(BytesDecoder(truncated), parsed_schema, named_schemas)
+
+
 def test_tuple_writer_picks_correct_union_path():
     """https://github.com/fastavro/fastavro/issues/509"""
     schema = {
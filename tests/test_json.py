@@ -7,9 +7,20 @@ import pytest
 from fastavro import json_writer, json_reader
 from fastavro.schema import parse_schema
 from fastavro.validation import ValidationError
+from fastavro.io import json_decoder
 from fastavro.io.json_decoder import AvroJSONDecoder
 from fastavro.io.json_encoder import AvroJSONEncoder
-from fastavro.io.symbols import MapKeyMarker, String
+from fastavro.io.parser import Parser
+from fastavro.io.symbols import (
+    Alternative,
+    EnumLabels,
+    Long,
+    MapKeyMarker,
+    Null,
+    Sequence,
+    String,
+    NO_DEFAULT,
+)
 
 
 def roundtrip(schema, records, *, reader_schema=None, writer_kwargs={}):
@@ -999,3 +1010,149 @@ def test_json_aliases():
 
     output_records = roundtrip(schema, records, reader_schema=reader_schema)
     assert output_records == [{"new_field_1": "foo", "field_2": 10}]
+
+
+class StrictJSON:
+    """Stands in for orjson, which rejects NaN and Infinity"""
+
+    class JSONDecodeError(ValueError):
+        pass
+
+    @classmethod
+    def loads(cls, s):
+        def reject(constant):
+            raise cls.JSONDecodeError(constant)
+
+        return json.loads(s, parse_constant=reject)
+
+
+@pytest.mark.parametrize(
+    "orjson",
+    [json_decoder.orjson, None, StrictJSON],
+    ids=["installed", "json", "strict"],
+)
+def test_non_finite_doubles_roundtrip(monkeypatch, orjson):
+    """The json module writes NaN and Infinity, which stricter JSON parsers
+    reject, so make sure they can still be read back"""
+    monkeypatch.setattr(json_decoder, "orjson", orjson)
+
+    schema = {
+        "type": "record",
+        "name": "test_non_finite_doubles_roundtrip",
+        "fields": [{"name": "value", "type": "double"}],
+    }
+    records = [{"value": float("inf")}, {"value": float("-inf")}, {"value": 1.5}]
+
+    assert roundtrip(schema, records) == records
+
+    (new_record,) = roundtrip(schema, [{"value": float("nan")}])
+    assert new_record["value"] != new_record["value"]
+
+
+def test_parsed_schema_changes_are_seen_by_later_parsers():
+    schema = {
+        "type": "record",
+        "name": "test_parsed_schema_changes_are_seen_by_later_parsers",
+        "fields": [
+            {"name": "a", "type": "long"},
+            {"name": "b", "type": {"type": "array", "items": "string"}},
+        ],
+    }
+    parsed_schema = parse_schema(schema)
+
+    first = Parser(parsed_schema, {}, None)
+    second = Parser(parsed_schema, {}, None)
+    assert first.stack[1] is not second.stack[1]
+
+    records = [{"a": 1, "b": ["x", "y"]}, {"a": 2, "b": []}]
+    assert roundtrip(parsed_schema, records) == records
+
+    parsed_schema["fields"].append({"name": "c", "type": "string"})
+    records = [{"a": 1, "b": ["x"], "c": "z"}]
+    assert roundtrip(parsed_schema, records) == records
+
+
+def test_parser_splices_nested_sequences():
+    schema = {
+        "type": "record",
+        "name": "test_parser_splices_nested_sequences",
+        "fields": [
+            {
+                "name": "inner",
+                "type": {
+                    "type": "record",
+                    "name": "Inner",
+                    "fields": [{"name": "a", "type": ["null", "long"]}],
+                },
+            },
+            {"name": "b", "type": {"type": "array", "items": "Inner"}},
+        ],
+    }
+    named_schemas = {}
+    parsed_schema = parse_schema(schema, named_schemas)
+    root = Parser(parsed_schema, named_schemas, None).stack[0]
+    assert not any(isinstance(symbol, Sequence) for symbol in root.production)
+
+    records = [{"inner": {"a": None}, "b": [{"a": 1}, {"a": None}]}]
+    assert roundtrip(schema, records) == records
+
+
+def test_terminals_without_default_are_shared():
+    assert String() is String()
+    assert String() is not MapKeyMarker()
+
+    with_default = String(default="a")
+    assert with_default is not String()
+    assert with_default.get_default() == "a"
+    assert String().default is NO_DEFAULT
+
+
+def test_alternative_get_index():
+    alternative = Alternative([Null(), Long(), String()], ["null", "long", "string"])
+    assert alternative.get_index("null") == 0
+    assert alternative.get_index("string") == 2
+
+    with pytest.raises(ValueError, match="int"):
+        alternative.get_index("int")
+
+
+def test_enum_labels_get_index():
+    enum_labels = EnumLabels(["A", "B", "C"])
+    assert enum_labels.get_index("A") == 0
+    assert enum_labels.get_index("C") == 2
+
+    with pytest.raises(ValueError, match="D"):
+        enum_labels.get_index("D")
+
+    assert EnumLabels(["A", "B", "A"]).get_index("A") == 0
+
+
+def test_reader_schema_changes_do_not_leak_into_other_readers():
+    schema = {
+        "name": "test_reader_schema_changes_do_not_leak",
+        "type": "record",
+        "fields": [
+            {"name": "field_1", "type": "string"},
+            {"name": "field_2", "type": "int"},
+        ],
+    }
+
+    reader_schema = {
+        "name": "test_reader_schema_changes_do_not_leak",
+        "type": "record",
+        "fields": [
+            {"name": "field_2", "type": "long"},
+            {"name": "field_3", "type": "string", "default": "bar"},
+        ],
+    }
+
+    records = [{"field_1": "foo", "field_2": 10}]
+    expected = [{"field_2": 10, "field_3": "bar"}]
+
+    new_file = StringIO()
+    json_writer(new_file, schema, records)
+    new_file.seek(0)
+    first_reader = json_reader(new_file, schema, reader_schema)
+    first_reader.reader_schema["fields"].append({"name": "extra", "type": "long"})
+
+    assert roundtrip(schema, records, reader_schema=reader_schema) == expected
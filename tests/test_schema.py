@@ -1,4 +1,5 @@
 from io import BytesIO
+from enum import Enum
 from os.path import join, abspath, dirname
 import pytest
 import fastavro
@@ -1388,3 +1389,24 @@ def test_namespace_respected():
     }
 
     fastavro.parse_schema(schema)
+
+
+def test_field_name_str_subclass():
+    """Field names that are str subclasses, like a str enum, are kept as
+    given since they cannot be interned"""
+
+    class FieldName(str, Enum):
+        ID = "id"
+
+    schema = {
+        "type": "record",
+        "name": "test_field_name_str_subclass",
+        "fields": [{"name": FieldName.ID, "type": "int"}],
+    }
+    parsed_schema = fastavro.parse_schema(schema)
+    assert parsed_schema["fields"][0]["name"] is FieldName.ID
+
+    new_file = BytesIO()
+    fastavro.writer(new_file, schema, [{"id": 1}])
+    new_file.seek(0)
+    assert list(fastavro.reader(new_file)) == [{"id": 1}]
@@ -72,6 +72,61 @@ def test_evolution_add_field_without_default():
         bytes_with_schema_to_avro(schema_dict_a_c, record_bytes_a)
 
 
+def test_evolution_is_applied_to_every_record():
+    """The field matching is worked out once per schema pair and reused for
+    every record read with it"""
+    writer_schema = {
+        "namespace": "example.avro2",
+        "type": "record",
+        "name": "evtest",
+        "fields": [
+            {"name": "a", "type": "int"},
+            {"name": "old", "type": "string"},
+            {"name": "dropped", "type": "string"},
+        ],
+    }
+    reader_schema = {
+        "namespace": "example.avro2",
+        "type": "record",
+        "name": "evtest",
+        "fields": [
+            {"name": "new", "type": "string", "aliases": ["old"]},
+            {"name": "a", "type": "long"},
+            {"name": "added", "type": "int", "default": 7},
+        ],
+    }
+    records = [{"a": i, "old": str(i), "dropped": "x" * i} for i in range(10)]
+
+    bio = BytesIO()
+    fastavro.writer(bio, writer_schema, records)
+
+    for _ in range(2):
+        bio.seek(0)
+        assert list(fastavro.reader(bio, reader_schema)) == [
+            {"a": i, "new": str(i), "added": 7} for i in range(10)
+        ]
+
+    # The matching belongs to the reader, so a later read sees changes made to
+    # the reader schema in the meantime
+    parsed_writer_schema = fastavro.parse_schema(writer_schema)
+    parsed_reader_schema = fastavro.parse_schema(reader_schema)
+    bio = BytesIO()
+    fastavro.schemaless_writer(bio, parsed_writer_schema, records[1])
+
+    bio.seek(0)
+    assert fastavro.schemaless_reader(
+        bio, parsed_writer_schema, parsed_reader_schema
+    ) == {"a": 1, "new": "1", "added": 7}
+
+    parsed_reader_schema["fields"].append(
+        {"name": "later", "type": "string", "default": "z"}
+    )
+    bio.seek(0)
+    assert fastavro.schemaless_reader(
+        bio, parsed_writer_schema, parsed_reader_schema
+    ) == {"a": 1, "new": "1", "added": 7, "later": "z"}
+
+
 def test_enum_evolution_no_default_failure():
     original_schema = {
         "type": "enum",